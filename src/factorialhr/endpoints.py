@@ -1,19 +1,60 @@
 """Implements the endpoints."""
 
+import collections
 import datetime
+import functools
+import json
 import typing
 
 import httpx
+import pydantic
 
 from factorialhr import models
 
+T = typing.TypeVar("T", bound=pydantic.BaseModel)
+
+
+@functools.cache
+def _list_adapter(model: type[T]) -> pydantic.TypeAdapter[list[T]]:
+    """Return the adapter validating a list of `model`, building it once per model."""
+    return pydantic.TypeAdapter(list[model])  # type: ignore[valid-type]
+
 
 class NetworkHandler:
     """Factorial api class."""
 
-    def __init__(self, authorizer: httpx.Auth, base_url: str = "https://api.factorialhr.com"):
-        headers = {"accept": "application/json"}
-        self._client = httpx.AsyncClient(base_url=base_url, headers=headers, auth=authorizer)
+    def __init__(
+            self,
+            authorizer: httpx.Auth,
+            base_url: str = "https://api.factorialhr.com",
+            *,
+            etag_cache: bool = False,
+            etag_cache_maxsize: int = 128,
+            **kwargs,
+    ):
+        """Create the client session.
+
+        If `etag_cache` is set, the bodies of get responses carrying an etag are kept and revalidated with
+        `If-None-Match` on the next identical request, reusing the kept body if the server answers 304. At most
+        `etag_cache_maxsize` responses are kept, the least recently used is dropped first. Further keyword arguments
+        are passed to `httpx.AsyncClient`.
+        """
+        if "auth" in kwargs:
+            msg = "authentication is configured by `authorizer`, do not pass `auth`"
+            raise TypeError(msg)
+        headers = httpx.Headers({"accept": "application/json"})
+        headers.update(kwargs.pop("headers", None))
+        self._client = httpx.AsyncClient(
+            base_url=f"{base_url.rstrip('/')}/api/",
+            headers=headers,
+            auth=authorizer,
+            **kwargs,
+        )
+        # maps the url of a get request to the etag and body of its last response
+        self._etags: collections.OrderedDict[str, tuple[str, bytes]] | None = (
+            collections.OrderedDict() if etag_cache else None
+        )
+        self._etags_maxsize = etag_cache_maxsize
 
     async def close(self):
         """Close the client session."""
@@ -25,189 +66,218 @@ class NetworkHandler:
     async def __aenter__(self) -> "NetworkHandler":
         return self
 
+    async def _request(self, method: str, endpoint: str, **kwargs) -> bytes:
+        etags = self._etags if method == "GET" else None
+        cached = None
+        if etags is not None:
+            url = str(httpx.URL(endpoint, params=kwargs.get("params")))
+            cached = etags.get(url)
+        if cached is not None:
+            headers = httpx.Headers(kwargs.pop("headers", None))
+            headers["if-none-match"] = cached[0]
+            kwargs["headers"] = headers
+        resp = await self._client.request(method, endpoint, **kwargs)
+        if etags is not None and cached is not None and resp.status_code == httpx.codes.NOT_MODIFIED:
+            etags.move_to_end(url)
+            return cached[1]
+        resp.raise_for_status()
+        if etags is not None and (etag := resp.headers.get("etag")):
+            etags[url] = (etag, resp.content)
+            etags.move_to_end(url)
+            if len(etags) > self._etags_maxsize:
+                etags.popitem(last=False)
+        return resp.content
+
     async def get(self, endpoint: str, **kwargs) -> typing.Any:
         """Perform a get request."""
-        resp = await self._client.get("/api/" + endpoint, **kwargs)
-        resp.raise_for_status()
-        return resp.json()
+        return json.loads(await self._request("GET", endpoint, **kwargs))
 
     async def post(self, endpoint: str, **kwargs) -> typing.Any:
         """Perform a post request."""
-        resp = await self._client.post("/api/" + endpoint, **kwargs)
-        resp.raise_for_status()
-        return resp.json()
+        return json.loads(await self._request("POST", endpoint, **kwargs))
 
     async def put(self, endpoint: str, **kwargs) -> typing.Any:
         """Perform a put request."""
-        resp = await self._client.put("/api/" + endpoint, **kwargs)
-        resp.raise_for_status()
-        return resp.json()
+        return json.loads(await self._request("PUT", endpoint, **kwargs))
 
     async def delete(self, endpoint: str, **kwargs) -> typing.Any:
         """Perform a delete request."""
-        resp = await self._client.delete("/api/" + endpoint, **kwargs)
-        resp.raise_for_status()
-        return resp.json()
+        return json.loads(await self._request("DELETE", endpoint, **kwargs))
+
+    async def get_raw(self, endpoint: str, **kwargs) -> bytes:
+        """Perform a get request and return the undecoded response body."""
+        return await self._request("GET", endpoint, **kwargs)
 
+    async def post_raw(self, endpoint: str, **kwargs) -> bytes:
+        """Perform a post request and return the undecoded response body."""
+        return await self._request("POST", endpoint, **kwargs)
+
+    async def put_raw(self, endpoint: str, **kwargs) -> bytes:
+        """Perform a put request and return the undecoded response body."""
+        return await self._request("PUT", endpoint, **kwargs)
+
+    async def delete_raw(self, endpoint: str, **kwargs) -> bytes:
+        """Perform a delete request and return the undecoded response body."""
+        return await self._request("DELETE", endpoint, **kwargs)
+
+
+class Endpoint:
+    """Base class of all endpoints."""
+
+    __slots__ = ("api",)
+
+    _endpoint: typing.ClassVar[str]
 
-class EmployeesEndpoint:
     def __init__(self, api: NetworkHandler):
         self.api = api
 
-    @property
-    def _endpoint(self) -> str:
-        return "v2/core/employees"
+
+class EmployeesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v2/core/employees"
 
     async def all(self, *, full_text_name: str | None = None, **kwargs) -> list[models.Employee]:
         """Implement https://apidoc.factorialhr.com/reference/get_v2-core-employees."""
         params = {"full_text_name": full_text_name} if full_text_name is not None else {}
-        return [models.Employee(**e) for e in await self.api.get(self._endpoint, params=params, **kwargs)]
+        return _list_adapter(models.Employee).validate_json(
+            await self.api.get_raw(self._endpoint, params=params, **kwargs),
+        )
 
     async def create(self, **kwargs) -> models.Employee:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-core-employees."""
-        return models.Employee(**await self.api.post(self._endpoint, **kwargs))
+        return models.Employee.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, employee_id: int, **kwargs) -> models.Employee:
         """Implement https://apidoc.factorialhr.com/reference/get_v2-core-employees-id."""
-        return models.Employee(**await self.api.get(f"{self._endpoint}/{employee_id}", **kwargs))
+        return models.Employee.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{employee_id}", **kwargs))
 
     async def update(self, *, employee_id: int, **kwargs) -> models.Employee:
         """Implement https://apidoc.factorialhr.com/reference/put_v2-core-employees-id."""
-        return models.Employee(**await self.api.put(f"{self._endpoint}/{employee_id}", **kwargs))
+        return models.Employee.model_validate_json(await self.api.put_raw(f"{self._endpoint}/{employee_id}", **kwargs))
 
     async def invite(self, *, employee_id: int, **kwargs) -> models.Employee:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-core-employees-id-invite."""
-        return models.Employee(**await self.api.post(f"{self._endpoint}/{employee_id}/invite", **kwargs))
+        return models.Employee.model_validate_json(
+            await self.api.post_raw(f"{self._endpoint}/{employee_id}/invite", **kwargs),
+        )
 
     async def change_email(self, *, employee_id: int, **kwargs) -> models.Employee:
         """Implement https://apidoc.factorialhr.com/reference/put_v2-core-employees-id-email."""
-        return models.Employee(**await self.api.put(f"{self._endpoint}/{employee_id}/email", **kwargs))
+        return models.Employee.model_validate_json(
+            await self.api.put_raw(f"{self._endpoint}/{employee_id}/email", **kwargs),
+        )
 
     async def terminate(self, *, employee_id: int, **kwargs) -> models.Employee:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-core-employees-id-terminate."""
-        return models.Employee(**await self.api.post(f"{self._endpoint}/{employee_id}/terminate", **kwargs))
+        return models.Employee.model_validate_json(
+            await self.api.post_raw(f"{self._endpoint}/{employee_id}/terminate", **kwargs),
+        )
 
 
-class Webhook:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v2/core/webhooks"
+class Webhook(Endpoint):
+    __slots__ = ()
+    _endpoint = "v2/core/webhooks"
 
     async def all(self, **kwargs) -> list[models.Webhook]:
         """Implement https://apidoc.factorialhr.com/reference/get_v2-core-webhooks."""
-        return [models.Webhook(**w) for w in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Webhook).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> list[models.Webhook]:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-core-webhooks."""
-        return [models.Webhook(**w) for w in await self.api.post(self._endpoint, **kwargs)]
+        return _list_adapter(models.Webhook).validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def update(self, *, webhook_id: int, **kwargs) -> models.Webhook:
         """Implement https://apidoc.factorialhr.com/reference/put_v2-core-webhooks-id."""
-        return models.Webhook(**await self.api.put(f"{self._endpoint}/{webhook_id}", **kwargs))
+        return models.Webhook.model_validate_json(await self.api.put_raw(f"{self._endpoint}/{webhook_id}", **kwargs))
 
     async def delete(self, *, webhook_id: int, **kwargs) -> models.Webhook:
         """Implement https://apidoc.factorialhr.com/reference/delete_v2-core-webhooks-id."""
-        return models.Webhook(**await self.api.delete(f"{self._endpoint}/{webhook_id}", **kwargs))
+        return models.Webhook.model_validate_json(await self.api.delete_raw(f"{self._endpoint}/{webhook_id}", **kwargs))
 
 
-class MeEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/me"
+class MeEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/me"
 
     async def get(self, **kwargs) -> models.Me:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-me."""
-        return models.Me(**await self.api.get(self._endpoint, **kwargs))
+        return models.Me.model_validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
 
-class LocationsEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/locations"
+class LocationsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/locations"
 
     async def all(self, **kwargs) -> list[models.Location]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-locations."""
-        return [models.Location(**loc) for loc in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Location).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def get(self, *, location_id: int, **kwargs) -> models.Location:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-locations-id."""
-        return models.Location(**await self.api.get(f"{self._endpoint}/{location_id}", **kwargs))
+        return models.Location.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{location_id}", **kwargs))
 
 
-class HolidaysEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/company_holidays"
+class HolidaysEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/company_holidays"
 
     async def all(self, **kwargs) -> list[models.CompanyHoliday]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-company-holidays."""
-        return [models.CompanyHoliday(**h) for h in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.CompanyHoliday).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def get(self, *, holiday_id: int, **kwargs) -> models.CompanyHoliday:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-company-holidays-id."""
-        return models.CompanyHoliday(**await self.api.get(f"{self._endpoint}/{holiday_id}", **kwargs))
-
+        return models.CompanyHoliday.model_validate_json(
+            await self.api.get_raw(f"{self._endpoint}/{holiday_id}", **kwargs),
+        )
 
-class TeamsEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/core/teams"
+class TeamsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/core/teams"
 
     async def all(self, **kwargs) -> list[models.Team]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-teams."""
-        return [models.Team(**t) for t in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Team).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.Team:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-teams."""
-        return models.Team(**await self.api.post(self._endpoint, **kwargs))
+        return models.Team.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, team_id: int, **kwargs) -> models.Team:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-teams-id."""
-        return models.Team(**await self.api.get(f"{self._endpoint}/{team_id}", **kwargs))
+        return models.Team.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{team_id}", **kwargs))
 
     async def update(self, *, team_id: int, **kwargs) -> models.Team:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-core-teams-id."""
-        return models.Team(**await self.api.put(f"{self._endpoint}/{team_id}", **kwargs))
+        return models.Team.model_validate_json(await self.api.put_raw(f"{self._endpoint}/{team_id}", **kwargs))
 
     async def delete(self, *, team_id: int, **kwargs) -> models.Team:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-teams-id."""
-        return models.Team(**await self.api.delete(f"{self._endpoint}/{team_id}", **kwargs))
+        return models.Team.model_validate_json(await self.api.delete_raw(f"{self._endpoint}/{team_id}", **kwargs))
 
     async def assign_employee(self, *, team_id: int, employee_id: int, **kwargs) -> models.Team:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-teams-id-employees-employee-id."""
-        return models.Team(**await self.api.post(f"{self._endpoint}/{team_id}/employees/{employee_id}", **kwargs))
+        return models.Team.model_validate_json(
+            await self.api.post_raw(f"{self._endpoint}/{team_id}/employees/{employee_id}", **kwargs),
+        )
 
     async def update_employee(self, *, team_id: int, employee_id: int, **kwargs) -> models.Team:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-core-teams-id-employees-employee-id."""
-        return models.Team(**await self.api.put(f"{self._endpoint}/{team_id}/employees/{employee_id}", **kwargs))
+        return models.Team.model_validate_json(
+            await self.api.put_raw(f"{self._endpoint}/{team_id}/employees/{employee_id}", **kwargs),
+        )
 
     async def unassign_employee(self, *, team_id: int, employee_id: int, **kwargs) -> models.Team:
         """Implement https://apidoc.factorialhr.com/reference/delete_v1-core-teams-id-employees-employee-id."""
-        return models.Team(**await self.api.delete(f"{self._endpoint}/{team_id}/employees/{employee_id}", **kwargs))
+        return models.Team.model_validate_json(
+            await self.api.delete_raw(f"{self._endpoint}/{team_id}/employees/{employee_id}", **kwargs),
+        )
 
 
-class FoldersEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/core/folders"
+class FoldersEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/core/folders"
 
     async def all(self, *, name: str | None = None, active: bool | None = None, **kwargs) -> list[models.Folder]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-folders."""
@@ -216,148 +286,138 @@ class FoldersEndpoint:
             params["name"] = name
         if active is not None:
             params["active"] = active
-        return [models.Folder(**f) for f in await self.api.get(self._endpoint, params=params, **kwargs)]
+        return _list_adapter(models.Folder).validate_json(
+            await self.api.get_raw(self._endpoint, params=params, **kwargs),
+        )
 
     async def create(self, **kwargs) -> models.Folder:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-folders."""
-        return models.Folder(**await self.api.post(self._endpoint, **kwargs))
+        return models.Folder.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, folder_id: int, **kwargs) -> models.Folder:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-folders-id."""
-        return models.Folder(**await self.api.post(f"{self._endpoint}/{folder_id}", **kwargs))
+        return models.Folder.model_validate_json(await self.api.post_raw(f"{self._endpoint}/{folder_id}", **kwargs))
 
     async def update(self, *, folder_id: int, **kwargs) -> models.Folder:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-core-folders-id."""
-        return models.Folder(**await self.api.put(f"{self._endpoint}/{folder_id}", **kwargs))
+        return models.Folder.model_validate_json(await self.api.put_raw(f"{self._endpoint}/{folder_id}", **kwargs))
 
 
-class DocumentsEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/core/documents"
+class DocumentsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/core/documents"
 
     async def all(self, **kwargs) -> list[models.Document]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-documents."""
-        return [models.Document(**d) for d in await self.api.put(self._endpoint, **kwargs)]
+        return _list_adapter(models.Document).validate_json(await self.api.put_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.Document:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-documents."""
-        return models.Document(**await self.api.post(self._endpoint, **kwargs))
+        return models.Document.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, document_id: int, **kwargs) -> models.Document:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-documents-id."""
-        return models.Document(**await self.api.get(f"{self._endpoint}/{document_id}", **kwargs))
+        return models.Document.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{document_id}", **kwargs))
 
     async def update(self, *, document_id: int, **kwargs) -> models.Document:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-core-documents-id."""
-        return models.Document(**await self.api.put(f"v1/core/documents/{document_id}", **kwargs))
+        return models.Document.model_validate_json(await self.api.put_raw(f"v1/core/documents/{document_id}", **kwargs))
 
     async def delete(self, *, document_id: int, **kwargs) -> models.Document:
         """Implement https://apidoc.factorialhr.com/reference/delete_v1-core-documents-id."""
-        return models.Document(**await self.api.delete(f"{self._endpoint}/{document_id}", **kwargs))
-
+        return models.Document.model_validate_json(
+            await self.api.delete_raw(f"{self._endpoint}/{document_id}", **kwargs),
+        )
 
-class LegalEntitiesEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/core/legal_entities"
+class LegalEntitiesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/core/legal_entities"
 
     async def all(self, **kwargs) -> list[models.LegalEntity]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-legal-entities."""
-        return [models.LegalEntity(**le) for le in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.LegalEntity).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def get(self, *, entity_id: int, **kwargs) -> models.LegalEntity:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-legal-entities-id."""
-        return models.LegalEntity(**await self.api.get(f"{self._endpoint}/{entity_id}", **kwargs))
+        return models.LegalEntity.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{entity_id}", **kwargs))
 
 
-class KeysEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/core/keys"
+class KeysEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/core/keys"
 
     async def all(self, **kwargs) -> list[models.Key]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-keys."""
-        return [models.Key(**k) for k in await self.api.put(self._endpoint, **kwargs)]
+        return _list_adapter(models.Key).validate_json(await self.api.put_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.Key:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-keys."""
-        return models.Key(**await self.api.post(self._endpoint, **kwargs))
+        return models.Key.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def delete(self, *, key_id: int, **kwargs) -> models.Key:
         """Implement https://apidoc.factorialhr.com/reference/delete_v1-core-keys-id."""
-        return models.Key(**await self.api.delete(f"{self._endpoint}/{key_id}", **kwargs))
+        return models.Key.model_validate_json(await self.api.delete_raw(f"{self._endpoint}/{key_id}", **kwargs))
 
 
-class TasksEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/core/tasks"
+class TasksEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/core/tasks"
 
     async def all(self, **kwargs) -> list[models.Task]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-tasks."""
-        return [models.Task(**t) for t in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Task).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.Task:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-tasks."""
-        return models.Task(**await self.api.post(self._endpoint, **kwargs))
+        return models.Task.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, task_id: int, **kwargs) -> models.Task:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-tasks-id."""
-        return models.Task(**await self.api.get(f"{self._endpoint}/{task_id}", **kwargs))
+        return models.Task.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{task_id}", **kwargs))
 
     async def update(self, *, task_id: int, **kwargs) -> models.Task:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-core-tasks-id."""
-        return models.Task(**await self.api.put(f"{self._endpoint}/{task_id}", **kwargs))
+        return models.Task.model_validate_json(await self.api.put_raw(f"{self._endpoint}/{task_id}", **kwargs))
 
     async def delete(self, *, task_id: int, **kwargs) -> models.Task:
         """Implement https://apidoc.factorialhr.com/reference/delete_v1-core-tasks-id."""
-        return models.Task(**await self.api.get(f"{self._endpoint}/{task_id}", **kwargs))
+        return models.Task.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{task_id}", **kwargs))
 
     async def resolve(self, *, task_id: int, **kwargs) -> models.Task:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-tasks-id-resolve."""
-        return models.Task(**await self.api.post(f"{self._endpoint}/{task_id}/resolve", **kwargs))
+        return models.Task.model_validate_json(await self.api.post_raw(f"{self._endpoint}/{task_id}/resolve", **kwargs))
 
     async def copy(self, *, task_id: int, **kwargs) -> models.Task:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-tasks-id-copy."""
-        return models.Task(**await self.api.post(f"{self._endpoint}/{task_id}/copy", **kwargs))
+        return models.Task.model_validate_json(await self.api.post_raw(f"{self._endpoint}/{task_id}/copy", **kwargs))
 
     async def get_files(self, *, task_id: int, **kwargs) -> list[models.File]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-tasks-id-files."""
-        return [models.File(**f) for f in await self.api.get(f"{self._endpoint}/{task_id}/files", **kwargs)]
+        return _list_adapter(models.File).validate_json(
+            await self.api.get_raw(f"{self._endpoint}/{task_id}/files", **kwargs),
+        )
 
     async def create_file(self, *, task_id: int, **kwargs) -> models.File:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-tasks-id-files."""
-        return models.File(**await self.api.post(f"{self._endpoint}/{task_id}/files", **kwargs))
+        return models.File.model_validate_json(await self.api.post_raw(f"{self._endpoint}/{task_id}/files", **kwargs))
 
     async def get_file(self, *, task_id: int, file_id: int, **kwargs) -> models.File:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-tasks-task-id-files-id."""
-        return models.File(**await self.api.get(f"{self._endpoint}/{task_id}/files/{file_id}", **kwargs))
+        return models.File.model_validate_json(
+            await self.api.get_raw(f"{self._endpoint}/{task_id}/files/{file_id}", **kwargs),
+        )
 
     async def delete_file(self, *, task_id: int, file_id: int, **kwargs) -> models.File:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-tasks-task-id-files-id."""
-        return models.File(**await self.api.post(f"{self._endpoint}/{task_id}/files/{file_id}", **kwargs))
+        return models.File.model_validate_json(
+            await self.api.post_raw(f"{self._endpoint}/{task_id}/files/{file_id}", **kwargs),
+        )
 
 
-class CustomFieldsEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v2/custom_fields/"
+class CustomFieldsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v2/custom_fields/"
 
     async def all(
             self,
@@ -378,17 +438,19 @@ class CustomFieldsEndpoint:
             params["slug_id"] = slug_id
         if slug_name is not None:
             params["slug_name"] = slug_name
-        return [
-            models.CustomField(**cf) for cf in await self.api.get(f"{self._endpoint}/fields", params=params, **kwargs)
-        ]
+        return _list_adapter(models.CustomField).validate_json(
+            await self.api.get_raw(f"{self._endpoint}/fields", params=params, **kwargs),
+        )
 
     async def create(self, **kwargs) -> models.CustomField:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-custom-fields-fields."""
-        return models.CustomField(**await self.api.post(f"{self._endpoint}/fields", **kwargs))
+        return models.CustomField.model_validate_json(await self.api.post_raw(f"{self._endpoint}/fields", **kwargs))
 
     async def delete(self, *, field_id: int, **kwargs) -> models.CustomField:
         """Implement https://apidoc.factorialhr.com/reference/delete_v2-custom-fields-fields-id."""
-        return models.CustomField(**await self.api.delete(f"{self._endpoint}/fields/{field_id}", **kwargs))
+        return models.CustomField.model_validate_json(
+            await self.api.delete_raw(f"{self._endpoint}/fields/{field_id}", **kwargs),
+        )
 
     async def get_values(
             self,
@@ -409,99 +471,93 @@ class CustomFieldsEndpoint:
             params["slug_id"] = slug_id
         if slug_name is not None:
             params["slug_name"] = slug_name
-        return [
-            models.CustomFieldValue(**cfv)
-            for cfv in await self.api.get(f"{self._endpoint}/values", params=params, **kwargs)
-        ]
+        return _list_adapter(models.CustomFieldValue).validate_json(
+            await self.api.get_raw(f"{self._endpoint}/values", params=params, **kwargs),
+        )
 
     async def update_value(self, **kwargs) -> models.CustomField:
         """Implement https://apidoc.factorialhr.com/reference/put_v2-custom-fields-values."""
-        return models.CustomField(**await self.api.put(self._endpoint, **kwargs))
+        return models.CustomField.model_validate_json(await self.api.put_raw(self._endpoint, **kwargs))
 
 
-class PostsEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/posts"
+class PostsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/posts"
 
     async def all(self, **kwargs) -> list[models.Post]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-posts."""
-        return [models.Post(**p) for p in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Post).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.Post:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-posts."""
-        return models.Post(**await self.api.post(self._endpoint, **kwargs))
+        return models.Post.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, post_id: int, **kwargs) -> models.Post:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-posts-id."""
-        return models.Post(**await self.api.post(f"{self._endpoint}/{post_id}", **kwargs))
+        return models.Post.model_validate_json(await self.api.post_raw(f"{self._endpoint}/{post_id}", **kwargs))
 
     async def update(self, *, post_id: int, **kwargs) -> models.Post:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-posts-id."""
-        return models.Post(**await self.api.put(f"{self._endpoint}/{post_id}", **kwargs))
+        return models.Post.model_validate_json(await self.api.put_raw(f"{self._endpoint}/{post_id}", **kwargs))
 
     async def delete(self, *, post_id: int, **kwargs) -> models.Post:
         """Implement https://apidoc.factorialhr.com/reference/delete_v1-posts-id."""
-        return models.Post(**await self.api.delete(f"{self._endpoint}/{post_id}", **kwargs))
+        return models.Post.model_validate_json(await self.api.delete_raw(f"{self._endpoint}/{post_id}", **kwargs))
 
 
-class BulkEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v2/core/bulk"
+class BulkEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v2/core/bulk"
 
     async def employees(self, **kwargs) -> list[models.Employee]:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-core-bulk-employee."""
-        return [models.Employee(**e) for e in await self.api.post(f"{self._endpoint}/employees", **kwargs)]
+        return _list_adapter(models.Employee).validate_json(
+            await self.api.post_raw(f"{self._endpoint}/employees", **kwargs),
+        )
 
     async def attendance(self, **kwargs) -> list[models.Attendance]:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-core-bulk-attendance."""
-        return [models.Attendance(**a) for a in await self.api.post(f"{self._endpoint}/attendance", **kwargs)]
+        return _list_adapter(models.Attendance).validate_json(
+            await self.api.post_raw(f"{self._endpoint}/attendance", **kwargs),
+        )
 
     async def contract_versions(self, **kwargs) -> list[models.ContractVersion]:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-core-bulk-contract-version."""
-        return [
-            models.ContractVersion(**a) for a in await self.api.post(f"{self._endpoint}/contract_version", **kwargs)
-        ]
-
+        return _list_adapter(models.ContractVersion).validate_json(
+            await self.api.post_raw(f"{self._endpoint}/contract_version", **kwargs),
+        )
 
-class CustomTablesEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/core/custom/tables"
+class CustomTablesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/core/custom/tables"
 
     async def all(self, *, topic_name: str | None = None, **kwargs) -> list[models.CustomTable]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-custom-tables."""
         params = {"topic_name": topic_name} if topic_name else {}
-        return [models.CustomTable(**ct) for ct in await self.api.get(self._endpoint, params=params, **kwargs)]
+        return _list_adapter(models.CustomTable).validate_json(
+            await self.api.get_raw(self._endpoint, params=params, **kwargs),
+        )
 
     async def create(self, **kwargs) -> models.CustomTable:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-custom-tables."""
-        return models.CustomTable(**await self.api.post(self._endpoint, **kwargs))
+        return models.CustomTable.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, table_id: int, **kwargs) -> models.CustomTable:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-custom-tables-id."""
-        return models.CustomTable(**await self.api.get(f"{self._endpoint}/{table_id}", **kwargs))
+        return models.CustomTable.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{table_id}", **kwargs))
 
     async def get_fields(self, *, table_id: int, **kwargs) -> list[models.CustomTableField]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-custom-tables-id-fields."""
-        return [
-            models.CustomTableField(**ctf)
-            for ctf in await self.api.get(f"{self._endpoint}/{table_id}/fields", **kwargs)
-        ]
+        return _list_adapter(models.CustomTableField).validate_json(
+            await self.api.get_raw(f"{self._endpoint}/{table_id}/fields", **kwargs),
+        )
 
     async def create_field(self, *, table_id: int, **kwargs) -> models.CustomField:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-core-custom-tables-id-fields."""
-        return models.CustomField(**await self.api.post(f"{self._endpoint}/{table_id}/fields", **kwargs))
+        return models.CustomField.model_validate_json(
+            await self.api.post_raw(f"{self._endpoint}/{table_id}/fields", **kwargs),
+        )
 
     async def get_employee_fields(self, *, table_id: int, employee_id: int, **kwargs):
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-custom-tables-id-values-employee-id."""
@@ -512,55 +568,49 @@ class CustomTablesEndpoint:
         raise NotImplementedError("Not implemented because of lacking documentation")
 
 
-class EventsEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/core/events"
+class EventsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/core/events"
 
     async def get_triggered(self, **kwargs) -> list[models.Event]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-core-events."""
-        return [models.Event(**e) for e in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Event).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
 
-class WorkplacesEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v2/core/workplaces"
+class WorkplacesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v2/core/workplaces"
 
     async def all(self, **kwargs) -> list[models.Workplace]:
         """Implement https://apidoc.factorialhr.com/reference/get_v2-core-workplaces."""
-        return [models.Workplace(**w) for w in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Workplace).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.Workplace:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-core-workplaces."""
-        return models.Workplace(**await self.api.post(self._endpoint, **kwargs))
+        return models.Workplace.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, workplace_id: int, **kwargs) -> models.Workplace:
         """Implement https://apidoc.factorialhr.com/reference/get_v2-core-workplaces-id."""
-        return models.Workplace(**await self.api.get(f"{self._endpoint}/{workplace_id}", **kwargs))
+        return models.Workplace.model_validate_json(
+            await self.api.get_raw(f"{self._endpoint}/{workplace_id}", **kwargs),
+        )
 
     async def update(self, *, workplace_id: int, **kwargs) -> models.Workplace:
         """Implement https://apidoc.factorialhr.com/reference/put_v2-core-workplaces-id."""
-        return models.Workplace(**await self.api.put(f"{self._endpoint}/{workplace_id}", **kwargs))
+        return models.Workplace.model_validate_json(
+            await self.api.put_raw(f"{self._endpoint}/{workplace_id}", **kwargs),
+        )
 
     async def delete(self, *, workplace_id: int, **kwargs) -> models.Workplace:
         """Implement https://apidoc.factorialhr.com/reference/delete_v2-core-workplaces-id."""
-        return models.Workplace(**await self.api.delete(f"{self._endpoint}/{workplace_id}", **kwargs))
-
+        return models.Workplace.model_validate_json(
+            await self.api.delete_raw(f"{self._endpoint}/{workplace_id}", **kwargs),
+        )
 
-class AttendanceEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
 
-    @property
-    def _endpoint(self) -> str:
-        return "v2/time/attendance"
+class AttendanceEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v2/time/attendance"
 
     async def all(
             self,
@@ -577,80 +627,71 @@ class AttendanceEndpoint:
             params.append(("date_from", str(date_from)))
         if date_to is not None:
             params.append(("date_to", str(date_to)))
-        return [models.Attendance(**a) for a in await self.api.get(self._endpoint, params=params, **kwargs)]
+        return _list_adapter(models.Attendance).validate_json(
+            await self.api.get_raw(self._endpoint, params=params, **kwargs),
+        )
 
     async def create(self, **kwargs) -> models.Attendance:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-time-attendance."""
-        return models.Attendance(**await self.api.post(self._endpoint, **kwargs))
+        return models.Attendance.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
 
-class LeaveTypesEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/time/leave_types"
+class LeaveTypesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/time/leave_types"
 
     async def all(self, **kwargs) -> list[models.LeaveType]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-time-leave-types."""
-        return [models.LeaveType(**lt) for lt in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.LeaveType).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.LeaveType:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-time-leave-types."""
-        return models.LeaveType(**await self.api.post(self._endpoint, **kwargs))
+        return models.LeaveType.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def update(self, *, leave_type_id: int, **kwargs) -> models.LeaveType:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-time-leave-types-id."""
-        return models.LeaveType(**await self.api.put(f"{self._endpoint}/{leave_type_id}", **kwargs))
+        return models.LeaveType.model_validate_json(
+            await self.api.put_raw(f"{self._endpoint}/{leave_type_id}", **kwargs),
+        )
 
 
-class LeavesEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v2/time/leaves"
+class LeavesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v2/time/leaves"
 
     async def all(self, **kwargs) -> list[models.Leave]:
         """Implement https://apidoc.factorialhr.com/reference/get_v2-time-leaves."""
-        return [models.Leave(**leave) for leave in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Leave).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.Leave:
         """Implement https://apidoc.factorialhr.com/reference/post_v2-time-leaves."""
-        return models.Leave(**await self.api.post(self._endpoint, **kwargs))
+        return models.Leave.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, leave_id: int, **kwargs) -> models.Leave:
         """Implement https://apidoc.factorialhr.com/reference/get_v2-time-leaves-id."""
-        return models.Leave(**await self.api.get(f"{self._endpoint}/{leave_id}", **kwargs))
+        return models.Leave.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{leave_id}", **kwargs))
 
     async def update(self, *, leave_id: int, **kwargs) -> models.Leave:
         """Implement https://apidoc.factorialhr.com/reference/put_v2-time-leaves-id."""
-        return models.Leave(**await self.api.put(f"{self._endpoint}/{leave_id}", **kwargs))
+        return models.Leave.model_validate_json(await self.api.put_raw(f"{self._endpoint}/{leave_id}", **kwargs))
 
     async def delete(self, *, leave_id: int, **kwargs) -> models.Leave:
         """Implement https://apidoc.factorialhr.com/reference/delete_v2-time-leaves-id."""
-        return models.Leave(**await self.api.delete(f"{self._endpoint}/{leave_id}", **kwargs))
+        return models.Leave.model_validate_json(await self.api.delete_raw(f"{self._endpoint}/{leave_id}", **kwargs))
 
 
-class FamilySituationEndpoint:
+class FamilySituationEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/payroll/family_situation"
+
     def __init__(self, api: NetworkHandler):
-        self.api = api
+        super().__init__(api)
         raise NotImplementedError("This is france only and will be added in a future release")
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/payroll/family_situation"
 
-
-class JobPostingsEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/ats/job_postings"
+class JobPostingsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/ats/job_postings"
 
     async def all(
             self,
@@ -668,176 +709,165 @@ class JobPostingsEndpoint:
             params["team_id"] = team_id
         if location_id is not None:
             params["location_id"] = location_id
-        return [models.JobPosting(**p) for p in await self.api.get(self._endpoint, params=params, **kwargs)]
+        return _list_adapter(models.JobPosting).validate_json(
+            await self.api.get_raw(self._endpoint, params=params, **kwargs),
+        )
 
     async def create(self, **kwargs) -> models.JobPosting:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-ats-job-postings."""
-        return models.JobPosting(**await self.api.post(self._endpoint, **kwargs))
+        return models.JobPosting.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def update(self, *, job_id: int, **kwargs) -> models.JobPosting:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-ats-job-postings-id."""
-        return models.JobPosting(**await self.api.put(f"{self._endpoint}/{job_id}", **kwargs))
+        return models.JobPosting.model_validate_json(await self.api.put_raw(f"{self._endpoint}/{job_id}", **kwargs))
 
     async def delete(self, *, job_id: int, **kwargs) -> models.JobPosting:
         """Implement https://apidoc.factorialhr.com/reference/delete_v1-ats-job-postings-id."""
-        return models.JobPosting(**await self.api.delete(f"{self._endpoint}/{job_id}", **kwargs))
+        return models.JobPosting.model_validate_json(await self.api.delete_raw(f"{self._endpoint}/{job_id}", **kwargs))
 
     async def duplicate(self, *, job_id: int, **kwargs) -> models.JobPosting:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-ats-job-postings-id-duplicate."""
-        return models.JobPosting(**await self.api.post(f"{self._endpoint}/{job_id}", **kwargs))
+        return models.JobPosting.model_validate_json(await self.api.post_raw(f"{self._endpoint}/{job_id}", **kwargs))
 
 
-class CandidatesEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/ats/job_postings"
+class CandidatesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/ats/job_postings"
 
     async def all(self, **kwargs) -> list[models.Candidate]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-ats-candidates."""
-        return [models.Candidate(**p) for p in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Candidate).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.Candidate:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-ats-candidates."""
-        return models.Candidate(**await self.api.post(self._endpoint, **kwargs))
+        return models.Candidate.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def update(self, *, candidate_id: int, **kwargs) -> models.Candidate:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-ats-candidates-id."""
-        return models.Candidate(**await self.api.put(f"{self._endpoint}/{candidate_id}", **kwargs))
+        return models.Candidate.model_validate_json(
+            await self.api.put_raw(f"{self._endpoint}/{candidate_id}", **kwargs),
+        )
+
 
+class ContractVersionsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/payroll/contract_versions"
 
-class ContractVersionsEndpoint:
     def __init__(self, api: NetworkHandler):
-        self.api = api
+        super().__init__(api)
         raise NotImplementedError
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/payroll/contract_versions"
 
+class SupplementsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/payroll/supplements"
 
-class SupplementsEndpoint:
     def __init__(self, api: NetworkHandler):
-        self.api = api
+        super().__init__(api)
         raise NotImplementedError
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/payroll/supplements"
 
+class ShiftManagementEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/time/shifts_management"
 
-class ShiftManagementEndpoint:
     def __init__(self, api: NetworkHandler):
-        self.api = api
+        super().__init__(api)
         raise NotImplementedError
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/time/shifts_management"
 
+class BreaksEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/time/breaks"
 
-class BreaksEndpoint:
     def __init__(self, api: NetworkHandler):
-        self.api = api
+        super().__init__(api)
         # TODO: oauth2 only
         raise NotImplementedError
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/time/breaks"
 
+class ApplicationEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/ats/applications"
 
-class ApplicationEndpoint:
     def __init__(self, api: NetworkHandler):
-        self.api = api
+        super().__init__(api)
         raise NotImplementedError
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/ats/applications"
 
+class ATSMessagesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/ats/messages"
 
-class ATSMessagesEndpoint:
     def __init__(self, api: NetworkHandler):
-        self.api = api
+        super().__init__(api)
         raise NotImplementedError
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/ats/messages"
 
-
-class TimeOffPoliciesEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/time/policies"
+class TimeOffPoliciesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/time/policies"
 
     async def all(self, **kwargs) -> list[models.TimeOffPolicy]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-time-policies."""
-        return [models.TimeOffPolicy(**top) for top in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.TimeOffPolicy).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def get(self, *, policy_id: int, **kwargs) -> models.TimeOffPolicy:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-time-policies-id."""
-        return models.TimeOffPolicy(**await self.api.get(f"{self._endpoint}/{policy_id}", **kwargs))
+        return models.TimeOffPolicy.model_validate_json(
+            await self.api.get_raw(f"{self._endpoint}/{policy_id}", **kwargs),
+        )
 
 
-class ExpensesEndpoint:
+class ExpensesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/finance/expenses"
+
     def __init__(self, api: NetworkHandler):
-        self.api = api
+        super().__init__(api)
         # TODO: oauth2 only
         raise NotImplementedError
 
-    @property
-    def _endpoint(self) -> str:
-        return "v1/finance/expenses"
 
-
-class CompensationsEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/payroll/compensations"
+class CompensationsEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/payroll/compensations"
 
     async def all(self, **kwargs) -> list[models.Compensation]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-payroll-compensations."""
-        return [models.Compensation(**top) for top in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Compensation).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def create(self, **kwargs) -> models.Compensation:
         """Implement https://apidoc.factorialhr.com/reference/post_v1-payroll-compensations."""
-        return models.Compensation(**await self.api.post(self._endpoint, **kwargs))
+        return models.Compensation.model_validate_json(await self.api.post_raw(self._endpoint, **kwargs))
 
     async def get(self, *, compensation_id: int, **kwargs) -> models.Compensation:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-payroll-compensations-id."""
-        return models.Compensation(**await self.api.get(f"{self._endpoint}/{compensation_id}", **kwargs))
+        return models.Compensation.model_validate_json(
+            await self.api.get_raw(f"{self._endpoint}/{compensation_id}", **kwargs),
+        )
 
     async def update(self, *, compensation_id: int, **kwargs) -> models.Compensation:
         """Implement https://apidoc.factorialhr.com/reference/put_v1-payroll-compensations-id."""
-        return models.Compensation(**await self.api.put(f"{self._endpoint}/{compensation_id}", **kwargs))
+        return models.Compensation.model_validate_json(
+            await self.api.put_raw(f"{self._endpoint}/{compensation_id}", **kwargs),
+        )
 
     async def delete(self, *, compensation_id: int, **kwargs) -> models.Compensation:
         """Implement https://apidoc.factorialhr.com/reference/delete_v1-payroll-compensations-id."""
-        return models.Compensation(**await self.api.delete(f"{self._endpoint}/{compensation_id}", **kwargs))
+        return models.Compensation.model_validate_json(
+            await self.api.delete_raw(f"{self._endpoint}/{compensation_id}", **kwargs),
+        )
 
 
-class TaxonomiesEndpoint:
-    def __init__(self, api: NetworkHandler):
-        self.api = api
-
-    @property
-    def _endpoint(self) -> str:
-        return "v1/payroll/taxonomies"
+class TaxonomiesEndpoint(Endpoint):
+    __slots__ = ()
+    _endpoint = "v1/payroll/taxonomies"
 
     async def all(self, **kwargs) -> list[models.Taxonomy]:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-payroll-taxonomies."""
-        return [models.Taxonomy(**top) for top in await self.api.get(self._endpoint, **kwargs)]
+        return _list_adapter(models.Taxonomy).validate_json(await self.api.get_raw(self._endpoint, **kwargs))
 
     async def get(self, *, taxonomy_id: int, **kwargs) -> models.Taxonomy:
         """Implement https://apidoc.factorialhr.com/reference/get_v1-payroll-taxonomies-id."""
-        return models.Taxonomy(**await self.api.get(f"{self._endpoint}/{taxonomy_id}", **kwargs))
+        return models.Taxonomy.model_validate_json(await self.api.get_raw(f"{self._endpoint}/{taxonomy_id}", **kwargs))
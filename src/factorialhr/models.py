@@ -12,6 +12,8 @@ class HalfDay(enum.StrEnum):
 
 
 class Employee(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     first_name: str
     last_name: str
@@ -42,12 +44,14 @@ class Employee(pydantic.BaseModel):
     timeoff_manager_id: int | None
     social_security_number: str | None
     timeoff_policy_id: int
-    team_ids: list[int]
+    team_ids: tuple[int, ...]
     phone_number: str | None
     company_identifier: str | None
 
 
 class Webhook(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     subscription_type: str
     name: str | None
@@ -57,6 +61,8 @@ class Webhook(pydantic.BaseModel):
 
 
 class Me(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     email: str
     full_name: str
     first_name: str
@@ -66,6 +72,8 @@ class Me(pydantic.BaseModel):
 
 
 class Location(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     name: str
     country: str
@@ -76,10 +84,12 @@ class Location(pydantic.BaseModel):
     address_line_2: str | None
     postal_code: str | None
     timezone: str
-    company_holiday_ids: list[int]
+    company_holiday_ids: tuple[int, ...]
 
 
 class CompanyHoliday(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     summary: str | None  # TODO: check which ones are required
     description: str | None
@@ -89,15 +99,19 @@ class CompanyHoliday(pydantic.BaseModel):
 
 
 class Team(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     name: str
-    employee_ids: list[int]
-    lead_ids: list[int]
+    employee_ids: tuple[int, ...]
+    lead_ids: tuple[int, ...]
     description: str | None
     avatar: str | None
 
 
 class Folder(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     company_id: int
     name: str
@@ -107,6 +121,8 @@ class Folder(pydantic.BaseModel):
 
 
 class Document(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     employee_id: int | None
     company_id: int
@@ -119,6 +135,8 @@ class Document(pydantic.BaseModel):
 
 
 class LegalEntity(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     city: str | None
     state: str | None
@@ -132,6 +150,8 @@ class LegalEntity(pydantic.BaseModel):
 
 
 class Key(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     name: str
     token_digest: str
@@ -139,15 +159,19 @@ class Key(pydantic.BaseModel):
 
 
 class Task(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     name: str
     content: str | None
     due_on: datetime.date | None
-    assignee_ids: list[int]
+    assignee_ids: tuple[int, ...]
     completed_at: datetime.datetime | None
 
 
 class File(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     task_id: int
     filename: str
@@ -155,6 +179,8 @@ class File(pydantic.BaseModel):
 
 
 class CustomFieldChoiceOption(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     label: str
     value: str
@@ -169,6 +195,8 @@ class CustomFieldType(enum.StrEnum):
 
 
 class CustomField(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     label: str
     identifier: str
@@ -181,6 +209,8 @@ class CustomField(pydantic.BaseModel):
 
 
 class CustomFieldValue(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     label: str
     value: str
@@ -200,6 +230,8 @@ class PostType(enum.StrEnum):
 
 
 class Post(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     title: str
     description: str
@@ -221,6 +253,8 @@ class Post(pydantic.BaseModel):
 
 
 class Attendance(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     employee_id: int
     clock_in: datetime.datetime
@@ -239,6 +273,8 @@ class Attendance(pydantic.BaseModel):
 
 
 class ContractVersion(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     # TODO: it looks like that fields are added based on language
     id: int
     employee_id: int
@@ -274,11 +310,13 @@ class ContractVersion(pydantic.BaseModel):
     fr_mutual_id: int | None
     fr_professional_category_id: int | None
     fr_work_type_id: int | None
-    compensation_ids: list[int]
+    compensation_ids: tuple[int, ...]
     de_contract_type_id: int | None
 
 
 class CustomTable(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     name: str
     created_at: datetime.datetime
@@ -289,12 +327,16 @@ class CustomTable(pydantic.BaseModel):
 
 
 class CustomTableField(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     label: str
     position: int
 
 
 class Event(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: str
     type: str
     name: str
@@ -303,6 +345,8 @@ class Event(pydantic.BaseModel):
 
 
 class Workplace(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     name: str
     country: str
@@ -319,6 +363,8 @@ class Workplace(pydantic.BaseModel):
 
 
 class LeaveType(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     accrues: bool
     active: bool
@@ -335,6 +381,8 @@ class LeaveType(pydantic.BaseModel):
 
 
 class Leave(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     approved: bool
     description: str | None
@@ -354,6 +402,8 @@ class JobPostingStatus(enum.StrEnum):
 
 
 class JobPosting(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     created_at: datetime.datetime
     title: str
@@ -376,6 +426,8 @@ class JobPosting(pydantic.BaseModel):
 
 
 class Candidate(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     first_name: str
     last_name: str
@@ -388,6 +440,8 @@ class Candidate(pydantic.BaseModel):
 
 
 class TimeOffPolicy(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     main: bool
     name: str
@@ -430,6 +484,8 @@ class Calculation(enum.StrEnum):
 
 
 class Compensation(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     contract_version_id: int
     description: str | None
@@ -447,6 +503,8 @@ class Compensation(pydantic.BaseModel):
 
 
 class Taxonomy(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
     id: int
     name: str
     archived: bool